@@ -7,7 +7,13 @@ from backend.models.flags import RiskFlag
 
 
 class BaseAnalyzer(ABC):
-    """Base class for all analyzers."""
+    """
+    Base class for all analyzers.
+
+    Analyzers may rely on Applicant.corp_history being ordered newest first
+    (current corp at index 0). Connectors building an Applicant must sort it
+    once at ingest so analyzers never have to re-sort.
+    """
 
     name: str = "base"
     description: str = "Base analyzer"
@@ -18,6 +24,10 @@ class BaseAnalyzer(ABC):
         """
         Analyze an applicant and return risk flags.
 
+        Flags are built from values the analyzer already holds as the right
+        types, so implementations use RiskFlag.model_construct() to skip
+        validation. Schema conformance is checked in the analyzer tests.
+
         Args:
             applicant: The applicant to analyze
 
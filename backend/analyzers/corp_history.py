@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta
 
-from backend.models.applicant import Applicant
+from backend.models.applicant import Applicant, CorpHistoryEntry
 from backend.models.flags import (
     FlagCategory,
     FlagSeverity,
@@ -65,7 +65,7 @@ class CorpHistoryAnalyzer(BaseAnalyzer):
         if hostile_memberships:
             for entry in hostile_memberships:
                 flags.append(
-                    RiskFlag(
+                    RiskFlag.model_construct(
                         severity=FlagSeverity.RED,
                         category=FlagCategory.CORP_HISTORY,
                         code=RedFlags.KNOWN_SPY_CORP,
@@ -84,14 +84,17 @@ class CorpHistoryAnalyzer(BaseAnalyzer):
         # Check for rapid corp hopping
         now = datetime.utcnow()
         window_start = now - timedelta(days=self.RAPID_HOP_WINDOW_DAYS)
-        recent_corps = [
-            entry for entry in history
-            if entry.start_date >= window_start
-        ]
+        # History is newest first, so the window is a prefix - stop at the
+        # first older entry instead of scanning the whole history
+        recent_corps: list[CorpHistoryEntry] = []
+        for entry in history:
+            if entry.start_date < window_start:
+                break
+            recent_corps.append(entry)
 
         if len(recent_corps) >= self.RAPID_HOP_COUNT:
             flags.append(
-                RiskFlag(
+                RiskFlag.model_construct(
                     severity=FlagSeverity.RED,
                     category=FlagCategory.CORP_HISTORY,
                     code=RedFlags.RAPID_CORP_HOP,
@@ -113,7 +116,7 @@ class CorpHistoryAnalyzer(BaseAnalyzer):
         if current_corp and current_corp.duration_days is not None:
             if current_corp.duration_days < self.SHORT_TENURE_DAYS:
                 flags.append(
-                    RiskFlag(
+                    RiskFlag.model_construct(
                         severity=FlagSeverity.YELLOW,
                         category=FlagCategory.CORP_HISTORY,
                         code=YellowFlags.SHORT_TENURE,
@@ -128,11 +131,13 @@ class CorpHistoryAnalyzer(BaseAnalyzer):
                 )
 
         # Check for NPC corp patterns (potential awaiters/spies)
-        npc_stints = [entry for entry in history if entry.is_npc]
-        long_npc_stints = [e for e in npc_stints if e.duration_days and e.duration_days > 30]
+        long_npc_stints = [
+            e for e in history
+            if e.is_npc and e.duration_days and e.duration_days > 30
+        ]
         if len(long_npc_stints) >= 2:
             flags.append(
-                RiskFlag(
+                RiskFlag.model_construct(
                     severity=FlagSeverity.YELLOW,
                     category=FlagCategory.CORP_HISTORY,
                     code="NPC_CORP_PATTERN",
@@ -149,15 +154,19 @@ class CorpHistoryAnalyzer(BaseAnalyzer):
             )
 
         # GREEN FLAG: Established character
-        total_player_corp_days = sum(
-            e.duration_days or 0 for e in history if not e.is_npc
-        )
-        longest_tenure = max((e.duration_days or 0 for e in history), default=0)
+        total_player_corp_days = 0
+        longest_tenure = 0
+        for e in history:
+            days = e.duration_days or 0
+            if not e.is_npc:
+                total_player_corp_days += days
+            if days > longest_tenure:
+                longest_tenure = days
 
         if (total_player_corp_days >= self.ESTABLISHED_TOTAL_DAYS and
             longest_tenure >= self.ESTABLISHED_TENURE_DAYS):
             flags.append(
-                RiskFlag(
+                RiskFlag.model_construct(
                     severity=FlagSeverity.GREEN,
                     category=FlagCategory.CORP_HISTORY,
                     code=GreenFlags.ESTABLISHED,
@@ -174,7 +183,7 @@ class CorpHistoryAnalyzer(BaseAnalyzer):
         # GREEN FLAG: Clean history (no hostiles, reasonable stability)
         if not hostile_memberships and len(recent_corps) < 3:
             flags.append(
-                RiskFlag(
+                RiskFlag.model_construct(
                     severity=FlagSeverity.GREEN,
                     category=FlagCategory.CORP_HISTORY,
                     code=GreenFlags.CLEAN_HISTORY,
@@ -32,15 +32,28 @@ class KillboardAnalyzer(BaseAnalyzer):
     ACTIVE_PVPER_KILLS_90D = 50
     INACTIVE_DAYS = 60
 
+    HIGHSEC_REGIONS: frozenset[str] = frozenset({
+        "The Forge", "Domain", "Sinq Laison", "Metropolis", "Heimatar"
+    })
+
+    LOGI_SHIPS: frozenset[str] = frozenset({
+        "Guardian", "Oneiros", "Basilisk", "Scimitar",
+        "Lif", "Ninazu", "Apostle", "Minokawa"
+    })
+
     async def analyze(self, applicant: Applicant) -> list[RiskFlag]:
         """Analyze killboard data."""
         flags: list[RiskFlag] = []
         kb = applicant.killboard
 
+        # Every flag below is derived from kills - nothing to check without any
+        if kb.kills_total == 0:
+            return flags
+
         # RED FLAG: AWOX history
         if kb.awox_kills >= self.AWOX_THRESHOLD:
             flags.append(
-                RiskFlag(
+                RiskFlag.model_construct(
                     severity=FlagSeverity.RED,
                     category=FlagCategory.KILLBOARD,
                     code=RedFlags.AWOX_HISTORY,
@@ -56,7 +69,7 @@ class KillboardAnalyzer(BaseAnalyzer):
         # YELLOW FLAG: Low activity
         if kb.kills_90d < self.LOW_ACTIVITY_KILLS_90D and kb.kills_total > 0:
             flags.append(
-                RiskFlag(
+                RiskFlag.model_construct(
                     severity=FlagSeverity.YELLOW,
                     category=FlagCategory.KILLBOARD,
                     code=YellowFlags.LOW_ACTIVITY,
@@ -72,10 +85,9 @@ class KillboardAnalyzer(BaseAnalyzer):
 
         # YELLOW FLAG: Highsec-only activity
         if kb.top_regions:
-            highsec_regions = {"The Forge", "Domain", "Sinq Laison", "Metropolis", "Heimatar"}
-            if all(r in highsec_regions for r in kb.top_regions[:3]):
+            if all(r in self.HIGHSEC_REGIONS for r in kb.top_regions[:3]):
                 flags.append(
-                    RiskFlag(
+                    RiskFlag.model_construct(
                         severity=FlagSeverity.YELLOW,
                         category=FlagCategory.KILLBOARD,
                         code=YellowFlags.HIGH_SEC_ONLY,
@@ -88,7 +100,7 @@ class KillboardAnalyzer(BaseAnalyzer):
         # GREEN FLAG: Active PvPer
         if kb.kills_90d >= self.ACTIVE_PVPER_KILLS_90D:
             flags.append(
-                RiskFlag(
+                RiskFlag.model_construct(
                     severity=FlagSeverity.GREEN,
                     category=FlagCategory.KILLBOARD,
                     code=GreenFlags.ACTIVE_PVPER,
@@ -103,20 +115,15 @@ class KillboardAnalyzer(BaseAnalyzer):
             )
 
         # GREEN FLAG: Logi pilot (from ship preferences)
-        logi_ships = {
-            "Guardian", "Oneiros", "Basilisk", "Scimitar",
-            "Lif", "Ninazu", "Apostle", "Minokawa"
-        }
-        if any(ship in logi_ships for ship in kb.top_ships[:5]):
+        logi_ships_in_top = [s for s in kb.top_ships[:5] if s in self.LOGI_SHIPS]
+        if logi_ships_in_top:
             flags.append(
-                RiskFlag(
+                RiskFlag.model_construct(
                     severity=FlagSeverity.GREEN,
                     category=FlagCategory.KILLBOARD,
                     code=GreenFlags.LOGI_PILOT,
                     reason="Flies logistics ships",
-                    evidence={
-                        "logi_ships_in_top": [s for s in kb.top_ships[:5] if s in logi_ships]
-                    },
+                    evidence={"logi_ships_in_top": logi_ships_in_top},
                     confidence=0.8,
                 )
             )
@@ -5,13 +5,37 @@ import time
 from datetime import datetime
 
 from backend.models.applicant import Applicant
-from backend.models.flags import RiskFlag
+from backend.models.flags import RedFlags, RiskFlag, YellowFlags
 from backend.models.report import AnalysisReport, OverallRisk, ReportStatus
 
 from .base import BaseAnalyzer
 from .corp_history import CorpHistoryAnalyzer
 from .killboard import KillboardAnalyzer
 
+# Follow-up recommendation for each flag code, in the order they are reported
+_FLAG_RECOMMENDATIONS: tuple[tuple[str, str], ...] = (
+    (
+        RedFlags.KNOWN_SPY_CORP,
+        "Verify reason for leaving hostile organization - request explanation",
+    ),
+    (
+        RedFlags.AWOX_HISTORY,
+        "Review AWOX kills in detail - may be structure bashing or valid kills",
+    ),
+    (
+        RedFlags.RAPID_CORP_HOP,
+        "Investigate rapid corp changes - may indicate instability or spy behavior",
+    ),
+    (
+        YellowFlags.LOW_ACTIVITY,
+        "Verify pilot is active and will contribute - check recent login history",
+    ),
+    (
+        YellowFlags.SHORT_TENURE,
+        "New to current corp - consider probationary period",
+    ),
+)
+
 
 class RiskScorer:
     """
@@ -113,35 +137,11 @@ class RiskScorer:
 
     def _generate_recommendations(self, report: AnalysisReport) -> list[str]:
         """Generate actionable recommendations based on flags."""
-        recommendations: list[str] = []
-
         # Check for specific flag patterns
         flag_codes = {f.code for f in report.flags}
-
-        if "KNOWN_SPY_CORP" in flag_codes:
-            recommendations.append(
-                "Verify reason for leaving hostile organization - request explanation"
-            )
-
-        if "AWOX_HISTORY" in flag_codes:
-            recommendations.append(
-                "Review AWOX kills in detail - may be structure bashing or valid kills"
-            )
-
-        if "RAPID_CORP_HOP" in flag_codes:
-            recommendations.append(
-                "Investigate rapid corp changes - may indicate instability or spy behavior"
-            )
-
-        if "LOW_ACTIVITY" in flag_codes:
-            recommendations.append(
-                "Verify pilot is active and will contribute - check recent login history"
-            )
-
-        if "SHORT_TENURE" in flag_codes:
-            recommendations.append(
-                "New to current corp - consider probationary period"
-            )
+        recommendations = [
+            text for code, text in _FLAG_RECOMMENDATIONS if code in flag_codes
+        ]
 
         if report.suspected_alts:
             recommendations.append(
@@ -149,11 +149,12 @@ class RiskScorer:
                 "request disclosure"
             )
 
-        if report.overall_risk == OverallRisk.RED:
+        overall_risk = report.overall_risk
+        if overall_risk is OverallRisk.RED:
             recommendations.insert(0, "HIGH RISK - Recommend rejection or extensive vetting")
-        elif report.overall_risk == OverallRisk.YELLOW:
+        elif overall_risk is OverallRisk.YELLOW:
             recommendations.insert(0, "MODERATE RISK - Additional review recommended")
-        elif report.overall_risk == OverallRisk.GREEN:
+        elif overall_risk is OverallRisk.GREEN:
             recommendations.append("Low risk indicators - standard onboarding appropriate")
 
         if not recommendations:
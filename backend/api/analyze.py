@@ -1,5 +1,7 @@
 """Analysis API endpoints."""
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 
 from backend.analyzers.risk_scorer import RiskScorer
@@ -20,6 +22,9 @@ esi_client = ESIClient()
 zkill_client = ZKillClient()
 risk_scorer = RiskScorer()
 
+# Max characters analyzed at once by the batch endpoint
+BATCH_CONCURRENCY = 5
+
 
 @router.post("/analyze/{character_id}", response_model=AnalysisReport)
 async def analyze_character(
@@ -106,30 +111,45 @@ async def batch_analyze(request: BatchAnalysisRequest) -> BatchAnalysisResult:
     failed = 0
     reports: list[ReportSummary] = []
 
-    for char_id in request.character_ids:
-        try:
-            applicant = await esi_client.build_applicant(char_id)
-            applicant = await zkill_client.enrich_applicant(applicant)
-            report = await risk_scorer.analyze(applicant, request.requested_by)
-
-            reports.append(
-                ReportSummary(
-                    report_id=report.report_id,
-                    character_id=report.character_id,
-                    character_name=report.character_name,
-                    overall_risk=report.overall_risk,
-                    confidence=report.confidence,
-                    red_flag_count=report.red_flag_count,
-                    yellow_flag_count=report.yellow_flag_count,
-                    green_flag_count=report.green_flag_count,
-                    created_at=report.created_at,
-                    status=report.status,
-                )
-            )
-            completed += 1
+    # Analyses are dominated by ESI/zKill latency, so run them concurrently,
+    # capped so a large queue doesn't flood the upstream APIs
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def summarize(char_id: int) -> ReportSummary | None:
+        async with semaphore:
+            try:
+                applicant = await esi_client.build_applicant(char_id)
+                applicant = await zkill_client.enrich_applicant(applicant)
+                report = await risk_scorer.analyze(applicant, request.requested_by)
+            except Exception:
+                return None
+
+        return ReportSummary(
+            report_id=report.report_id,
+            character_id=report.character_id,
+            character_name=report.character_name,
+            overall_risk=report.overall_risk,
+            confidence=report.confidence,
+            red_flag_count=report.red_flag_count,
+            yellow_flag_count=report.yellow_flag_count,
+            green_flag_count=report.green_flag_count,
+            created_at=report.created_at,
+            status=report.status,
+        )
+
+    # Application queues often list the same character more than once -
+    # analyze each distinct character once and reuse its summary
+    unique_ids = list(dict.fromkeys(request.character_ids))
+    results = await asyncio.gather(*(summarize(char_id) for char_id in unique_ids))
+    summaries = dict(zip(unique_ids, results))
 
-        except Exception:
+    for char_id in request.character_ids:
+        summary = summaries[char_id]
+        if summary is None:
             failed += 1
+        else:
+            reports.append(summary)
+            completed += 1
 
     return BatchAnalysisResult(
         total_requested=len(request.character_ids),
@@ -161,13 +181,16 @@ async def analyze_by_name(
     return await analyze_character(char_id, requested_by)
 
 
+_QUICK_SUMMARIES: dict[OverallRisk, str] = {
+    OverallRisk.RED: "HIGH RISK - Multiple red flags detected",
+    OverallRisk.YELLOW: "MODERATE RISK - Review recommended",
+    OverallRisk.GREEN: "LOW RISK - No major concerns",
+}
+
+
 def _generate_quick_summary(report: AnalysisReport) -> str:
     """Generate a one-line summary for quick checks."""
-    if report.overall_risk == OverallRisk.RED:
-        return "HIGH RISK - Multiple red flags detected"
-    elif report.overall_risk == OverallRisk.YELLOW:
-        return "MODERATE RISK - Review recommended"
-    elif report.overall_risk == OverallRisk.GREEN:
-        return "LOW RISK - No major concerns"
-    else:
-        return "INSUFFICIENT DATA - Manual review needed"
+    return _QUICK_SUMMARIES.get(
+        report.overall_risk,
+        "INSUFFICIENT DATA - Manual review needed",
+    )
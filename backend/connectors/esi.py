@@ -1,6 +1,9 @@
 """ESI (EVE Swagger Interface) client for fetching character data."""
 
+import asyncio
+from collections.abc import Iterable
 from datetime import datetime
+from operator import itemgetter
 from typing import Any
 
 import httpx
@@ -26,9 +29,25 @@ class ESIClient:
 
     BASE_URL = "https://esi.evetech.net/latest"
     USER_AGENT = "EVE-Sentinel/1.0 (https://github.com/AreteDriver/EVE-Sentinel)"
+    NAMES_BATCH_SIZE = 1000  # Max IDs per /universe/names/ request
+
+    # NPC corps (starter corps, etc.)
+    NPC_CORPS: frozenset[int] = frozenset({
+        1000002, 1000003, 1000006, 1000007, 1000008, 1000009,
+        1000010, 1000011, 1000012, 1000013, 1000014, 1000015,
+        1000016, 1000017, 1000018, 1000019, 1000020, 1000044,
+        1000045, 1000046, 1000047, 1000048, 1000049, 1000050,
+        1000051, 1000052, 1000053, 1000054, 1000055, 1000056,
+        1000057, 1000058, 1000059, 1000060, 1000061, 1000062,
+        1000066, 1000077, 1000078, 1000079, 1000080, 1000081,
+        1000082, 1000083, 1000084, 1000085, 1000125, 1000127,
+    })
 
     def __init__(self) -> None:
         self._cache: TTLCache[str, Any] = TTLCache(maxsize=1000, ttl=300)  # 5 min cache
+        # Corp/alliance info and names are shared by many applicants and rarely
+        # change, so keep them longer and in a larger cache than per-character data
+        self._entity_cache: TTLCache[str, Any] = TTLCache(maxsize=8192, ttl=3600)
         self._client: httpx.AsyncClient | None = None
 
     async def _get_client(self) -> httpx.AsyncClient:
@@ -46,11 +65,20 @@ class ESIClient:
             await self._client.aclose()
             self._client = None
 
-    async def _get(self, endpoint: str) -> dict[str, Any] | list[Any]:
+    async def _get(
+        self,
+        endpoint: str,
+        cache: TTLCache[str, Any] | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """Make a GET request to ESI."""
+        if cache is None:
+            cache = self._cache
+
+        # Single lookup - a separate `in` check can race with TTL expiry
         cache_key = endpoint
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         client = await self._get_client()
         url = f"{self.BASE_URL}{endpoint}"
@@ -59,7 +87,18 @@ class ESIClient:
         response.raise_for_status()
 
         data = response.json()
-        self._cache[cache_key] = data
+        cache[cache_key] = data
+        return data
+
+    async def _post(self, endpoint: str, payload: Any) -> dict[str, Any] | list[Any]:
+        """Make a POST request to ESI."""
+        client = await self._get_client()
+        url = f"{self.BASE_URL}{endpoint}"
+
+        response = await client.post(url, json=payload)
+        response.raise_for_status()
+
+        data: dict[str, Any] | list[Any] = response.json()
         return data
 
     async def get_character(self, character_id: int) -> dict[str, Any]:
@@ -69,12 +108,12 @@ class ESIClient:
 
     async def get_corporation(self, corporation_id: int) -> dict[str, Any]:
         """Get corporation public info."""
-        data = await self._get(f"/corporations/{corporation_id}/")
+        data = await self._get(f"/corporations/{corporation_id}/", self._entity_cache)
         return dict(data) if isinstance(data, dict) else {}
 
     async def get_alliance(self, alliance_id: int) -> dict[str, Any]:
         """Get alliance public info."""
-        data = await self._get(f"/alliances/{alliance_id}/")
+        data = await self._get(f"/alliances/{alliance_id}/", self._entity_cache)
         return dict(data) if isinstance(data, dict) else {}
 
     async def get_character_corp_history(
@@ -94,6 +133,31 @@ class ESIClient:
                 return int(chars[0])
         return None
 
+    async def get_names(self, ids: Iterable[int]) -> dict[int, str]:
+        """
+        Resolve character/corporation/alliance IDs to names in bulk.
+
+        Uses /universe/names/, which resolves up to 1000 IDs of any type per
+        request, so a whole corp history costs one round trip instead of one
+        per entry. Names already resolved are served from cache.
+        """
+        names: dict[int, str] = {}
+        missing: list[int] = []
+        for entity_id in dict.fromkeys(ids):
+            cached = self._entity_cache.get(f"name:{entity_id}")
+            if cached is None:
+                missing.append(entity_id)
+            else:
+                names[entity_id] = cached
+
+        for i in range(0, len(missing), self.NAMES_BATCH_SIZE):
+            data = await self._post("/universe/names/", missing[i:i + self.NAMES_BATCH_SIZE])
+            for item in data if isinstance(data, list) else []:
+                names[item["id"]] = item["name"]
+                self._entity_cache[f"name:{item['id']}"] = item["name"]
+
+        return names
+
     async def build_applicant(self, character_id: int) -> Applicant:
         """
         Build an Applicant model from ESI data.
@@ -101,69 +165,62 @@ class ESIClient:
         This fetches all available public data for a character.
         For authenticated data (wallet, assets), use auth_bridge.
         """
-        # Fetch character info
-        char_data = await self.get_character(character_id)
+        # Character info and corp history are independent - fetch them together
+        char_data, history_data = await asyncio.gather(
+            self.get_character(character_id),
+            self.get_character_corp_history(character_id),
+        )
+
+        # One clock read so age and current tenure are measured from the same instant
+        now = datetime.utcnow()
 
         # Calculate character age
-        birthday = datetime.fromisoformat(char_data["birthday"].replace("Z", "+00:00"))
-        age_days = (datetime.utcnow() - birthday.replace(tzinfo=None)).days
-
-        # Fetch corp history
-        history_data = await self.get_character_corp_history(character_id)
-
-        # NPC corps (starter corps, etc.)
-        npc_corps = {
-            1000002, 1000003, 1000006, 1000007, 1000008, 1000009,
-            1000010, 1000011, 1000012, 1000013, 1000014, 1000015,
-            1000016, 1000017, 1000018, 1000019, 1000020, 1000044,
-            1000045, 1000046, 1000047, 1000048, 1000049, 1000050,
-            1000051, 1000052, 1000053, 1000054, 1000055, 1000056,
-            1000057, 1000058, 1000059, 1000060, 1000061, 1000062,
-            1000066, 1000077, 1000078, 1000079, 1000080, 1000081,
-            1000082, 1000083, 1000084, 1000085, 1000125, 1000127,
-        }
-
-        # Build corp history with durations
+        birthday = datetime.fromisoformat(char_data["birthday"]).replace(tzinfo=None)
+        age_days = (now - birthday).days
+
+        # Build corp history with durations, newest first as analyzers expect.
+        # ESI usually returns this order already, which Timsort handles in O(n)
         corp_history: list[CorpHistoryEntry] = []
         sorted_history = sorted(
             history_data,
-            key=lambda x: x["start_date"],
+            key=itemgetter("start_date"),
             reverse=True,
         )
 
-        for i, entry in enumerate(sorted_history):
-            start = datetime.fromisoformat(entry["start_date"].replace("Z", "+00:00"))
-            start = start.replace(tzinfo=None)
+        # Resolve all corp names in bulk rather than one request per entry
+        try:
+            corp_names = await self.get_names(
+                entry["corporation_id"] for entry in sorted_history
+            )
+        except Exception:
+            corp_names = {}
+
+        # Each start date is parsed once and carried over as the end date of
+        # the next (older) entry
+        end: datetime | None = None
+        for entry in sorted_history:
+            start = datetime.fromisoformat(entry["start_date"]).replace(tzinfo=None)
 
             # End date is start of next entry, or now for current
-            if i == 0:
-                end = None
-                duration = (datetime.utcnow() - start).days
+            if end is None:
+                duration = (now - start).days
             else:
-                end = datetime.fromisoformat(
-                    sorted_history[i - 1]["start_date"].replace("Z", "+00:00")
-                ).replace(tzinfo=None)
                 duration = (end - start).days
 
             corp_id = entry["corporation_id"]
 
-            # Fetch corp name
-            try:
-                corp_data = await self.get_corporation(corp_id)
-                corp_name = corp_data.get("name", f"Corp {corp_id}")
-            except Exception:
-                corp_name = f"Corp {corp_id}"
-
+            # Every field is already parsed/typed above, so skip re-validation
             corp_history.append(
-                CorpHistoryEntry(
+                CorpHistoryEntry.model_construct(
                     corporation_id=corp_id,
-                    corporation_name=corp_name,
+                    corporation_name=corp_names.get(corp_id, f"Corp {corp_id}"),
                     start_date=start,
                     end_date=end,
                     duration_days=duration,
-                    is_npc=corp_id in npc_corps,
+                    is_npc=corp_id in self.NPC_CORPS,
                 )
             )
+            end = start
 
         # Get current corp/alliance
         corp_id = char_data.get("corporation_id")
@@ -189,7 +246,7 @@ class ESIClient:
             corporation_name=corp_name,
             alliance_id=alliance_id,
             alliance_name=alliance_name,
-            birthday=birthday.replace(tzinfo=None),
+            birthday=birthday,
             security_status=char_data.get("security_status"),
             character_age_days=age_days,
             corp_history=corp_history,
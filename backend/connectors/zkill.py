@@ -1,6 +1,8 @@
 """zKillboard API client for fetching PvP data."""
 
-from datetime import datetime, timedelta
+import asyncio
+import heapq
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import httpx
@@ -46,9 +48,11 @@ class ZKillClient:
 
     async def _get(self, endpoint: str) -> list[dict[str, Any]]:
         """Make a GET request to zKillboard."""
+        # Single lookup - a separate `in` check can race with TTL expiry
         cache_key = endpoint
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         client = await self._get_client()
         url = f"{self.BASE_URL}{endpoint}"
@@ -100,10 +104,14 @@ class ZKillClient:
         - Ship preferences
         - Region activity
         """
-        kills = await self.get_character_kills(character_id, limit=500)
-        losses = await self.get_character_losses(character_id, limit=200)
+        kills, losses = await asyncio.gather(
+            self.get_character_kills(character_id, limit=500),
+            self.get_character_losses(character_id, limit=200),
+        )
 
-        now = datetime.utcnow()
+        # Killmail times are UTC ISO-8601 strings - compare them as aware datetimes
+        # so each row is parsed directly without rewriting or stripping the zone
+        now = datetime.now(UTC)
         thirty_days_ago = now - timedelta(days=30)
         ninety_days_ago = now - timedelta(days=90)
 
@@ -115,17 +123,16 @@ class ZKillClient:
         isk_destroyed = 0.0
         ships_used: dict[str, int] = {}
         regions: dict[str, int] = {}
-        fleet_sizes: list[int] = []
+        total_attackers = 0
 
         for kill in kills:
-            kill_time = datetime.fromisoformat(
-                kill.get("killmail_time", "2000-01-01T00:00:00Z").replace("Z", "+00:00")
-            ).replace(tzinfo=None)
+            kill_time = datetime.fromisoformat(kill.get("killmail_time", "2000-01-01T00:00:00Z"))
 
-            if kill_time >= thirty_days_ago:
-                kills_30d += 1
+            # The 30 day window is nested in the 90 day one
             if kill_time >= ninety_days_ago:
                 kills_90d += 1
+                if kill_time >= thirty_days_ago:
+                    kills_30d += 1
 
             # Check for AWOX (killed someone in same corp/alliance)
             victim = kill.get("victim", {})
@@ -139,15 +146,17 @@ class ZKillClient:
 
             # Track ships used
             attackers = kill.get("attackers", [])
-            fleet_sizes.append(len(attackers))
+            fleet_size = len(attackers)
+            total_attackers += fleet_size
 
             for attacker in attackers:
                 if attacker.get("character_id") == character_id:
                     ship = attacker.get("ship_type_id")
                     if ship:
-                        ships_used[str(ship)] = ships_used.get(str(ship), 0) + 1
+                        ship_key = str(ship)
+                        ships_used[ship_key] = ships_used.get(ship_key, 0) + 1
 
-                    if len(attackers) == 1:
+                    if fleet_size == 1:
                         solo_kills += 1
                     break
 
@@ -158,30 +167,31 @@ class ZKillClient:
             # Track region (would need ESI lookup for actual region name)
             solar_system = kill.get("solar_system_id")
             if solar_system:
-                regions[str(solar_system)] = regions.get(str(solar_system), 0) + 1
+                region_key = str(solar_system)
+                regions[region_key] = regions.get(region_key, 0) + 1
 
-        # Process losses
+        # Process losses in a single pass
         deaths_total = len(losses)
-        deaths_30d = sum(
-            1 for loss in losses
-            if datetime.fromisoformat(
-                loss.get("killmail_time", "2000-01-01T00:00:00Z").replace("Z", "+00:00")
-            ).replace(tzinfo=None) >= thirty_days_ago
-        )
+        deaths_30d = 0
+        isk_lost = 0.0
 
-        isk_lost = sum(
-            loss.get("zkb", {}).get("totalValue", 0)
-            for loss in losses
-        )
+        for loss in losses:
+            loss_time = datetime.fromisoformat(loss.get("killmail_time", "2000-01-01T00:00:00Z"))
+
+            if loss_time >= thirty_days_ago:
+                deaths_30d += 1
+
+            isk_lost += loss.get("zkb", {}).get("totalValue", 0)
 
-        # Top ships (by usage count)
-        top_ships = sorted(ships_used.keys(), key=lambda x: ships_used[x], reverse=True)[:10]
+        # Top ships (by usage count) - partial selection, no full sort
+        top_ships = heapq.nlargest(10, ships_used, key=ships_used.__getitem__)
 
         # Top regions
-        top_regions = sorted(regions.keys(), key=lambda x: regions[x], reverse=True)[:5]
+        top_regions = heapq.nlargest(5, regions, key=regions.__getitem__)
 
         # Average fleet size
-        avg_fleet = sum(fleet_sizes) / len(fleet_sizes) if fleet_sizes else None
+        # Every kill contributes one fleet size, so the running total is enough
+        avg_fleet = total_attackers / len(kills) if kills else None
 
         return KillboardStats(
             kills_total=len(kills),
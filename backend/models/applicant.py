@@ -96,7 +96,7 @@ class Applicant(BaseModel):
     character_age_days: int | None = None
 
     # Analysis components
-    corp_history: list[CorpHistoryEntry] = Field(default_factory=list)
+    corp_history: list[CorpHistoryEntry] = Field(default_factory=list)  # Newest first
     killboard: KillboardStats = Field(default_factory=KillboardStats)
     activity: ActivityPattern = Field(default_factory=ActivityPattern)
     assets: AssetSummary | None = None
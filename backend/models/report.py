@@ -69,9 +69,20 @@ class AnalysisReport(BaseModel):
 
     def calculate_risk(self) -> None:
         """Calculate overall risk from flags."""
-        self.red_flag_count = sum(1 for f in self.flags if f.severity == FlagSeverity.RED)
-        self.yellow_flag_count = sum(1 for f in self.flags if f.severity == FlagSeverity.YELLOW)
-        self.green_flag_count = sum(1 for f in self.flags if f.severity == FlagSeverity.GREEN)
+        # Tally all severities in one pass over the flags
+        red = yellow = green = 0
+        for flag in self.flags:
+            severity = flag.severity
+            if severity is FlagSeverity.RED:
+                red += 1
+            elif severity is FlagSeverity.YELLOW:
+                yellow += 1
+            elif severity is FlagSeverity.GREEN:
+                green += 1
+
+        self.red_flag_count = red
+        self.yellow_flag_count = yellow
+        self.green_flag_count = green
 
         # Risk calculation logic
         if self.red_flag_count >= 2:
@@ -0,0 +1,132 @@
+"""Test analyzers."""
+
+from datetime import datetime, timedelta
+
+from backend.analyzers.corp_history import CorpHistoryAnalyzer
+from backend.analyzers.killboard import KillboardAnalyzer
+from backend.analyzers.risk_scorer import RiskScorer
+from backend.models.applicant import Applicant, CorpHistoryEntry, KillboardStats
+from backend.models.flags import RiskFlag
+from backend.models.report import OverallRisk
+
+
+def _entry(corp_id: int, days_ago: int, duration: int, **kwargs) -> CorpHistoryEntry:
+    """Build a corp history entry that started `days_ago` days ago."""
+    start = datetime.utcnow() - timedelta(days=days_ago)
+    return CorpHistoryEntry(
+        corporation_id=corp_id,
+        corporation_name=f"Corp {corp_id}",
+        start_date=start,
+        duration_days=duration,
+        **kwargs,
+    )
+
+
+def _assert_valid(flags: list[RiskFlag]) -> None:
+    """Analyzers skip validation - make sure their flags still match the schema."""
+    for flag in flags:
+        assert RiskFlag.model_validate(flag.model_dump()) == flag
+
+
+async def test_corp_history_red_flags():
+    """Test hostile membership and rapid hopping are flagged."""
+    applicant = Applicant(
+        character_id=12345,
+        character_name="Test Pilot",
+        corp_history=[
+            _entry(98000005, 10, 10),
+            _entry(98000004, 40, 30),
+            _entry(98000003, 70, 30, is_hostile=True),
+            _entry(98000002, 100, 30),
+            _entry(1000009, 150, 50, is_npc=True),
+            _entry(1000010, 400, 200, is_npc=True),
+        ],
+    )
+
+    flags = await CorpHistoryAnalyzer().analyze(applicant)
+
+    _assert_valid(flags)
+    codes = [f.code for f in flags]
+    assert codes == [
+        "KNOWN_SPY_CORP",
+        "RAPID_CORP_HOP",
+        "SHORT_TENURE",
+        "NPC_CORP_PATTERN",
+    ]
+    assert flags[1].evidence["corp_count"] == 5
+
+
+async def test_corp_history_established():
+    """Test long, stable history earns green flags."""
+    applicant = Applicant(
+        character_id=12345,
+        character_name="Test Pilot",
+        corp_history=[
+            _entry(98000002, 800, 800),
+            _entry(1000009, 1000, 200, is_npc=True),
+        ],
+    )
+
+    flags = await CorpHistoryAnalyzer().analyze(applicant)
+
+    _assert_valid(flags)
+    assert [f.code for f in flags] == ["ESTABLISHED", "CLEAN_HISTORY"]
+    assert flags[0].evidence["total_player_corp_days"] == 800
+    assert flags[0].evidence["longest_tenure_days"] == 800
+
+
+async def test_killboard_flags():
+    """Test killboard flags for an active logi pilot with AWOX kills."""
+    applicant = Applicant(
+        character_id=12345,
+        character_name="Test Pilot",
+        killboard=KillboardStats(
+            kills_total=400,
+            kills_30d=20,
+            kills_90d=60,
+            awox_kills=4,
+            top_ships=["Drake", "Scimitar", "Guardian"],
+            top_regions=["The Forge", "Domain", "Heimatar"],
+        ),
+    )
+
+    flags = await KillboardAnalyzer().analyze(applicant)
+
+    _assert_valid(flags)
+    assert [f.code for f in flags] == [
+        "AWOX_HISTORY",
+        "HIGH_SEC_ONLY",
+        "ACTIVE_PVPER",
+        "LOGI_PILOT",
+    ]
+    assert flags[0].confidence == 0.9
+    assert flags[-1].evidence["logi_ships_in_top"] == ["Scimitar", "Guardian"]
+
+
+async def test_killboard_no_activity():
+    """Test a character with no killboard history gets no flags."""
+    applicant = Applicant(character_id=12345, character_name="Test Pilot")
+
+    assert await KillboardAnalyzer().analyze(applicant) == []
+
+
+async def test_risk_scorer_recommendations():
+    """Test the scorer turns flags into recommendations."""
+    applicant = Applicant(
+        character_id=12345,
+        character_name="Test Pilot",
+        corp_history=[_entry(98000003, 10, 10, is_hostile=True)],
+        killboard=KillboardStats(kills_total=40, kills_90d=5, awox_kills=2),
+    )
+
+    report = await RiskScorer().analyze(applicant)
+
+    assert report.overall_risk == OverallRisk.RED
+    assert report.analyzers_run == ["killboard", "corp_history"]
+    assert report.recommendations == [
+        "HIGH RISK - Recommend rejection or extensive vetting",
+        "Verify reason for leaving hostile organization - request explanation",
+        "Review AWOX kills in detail - may be structure bashing or valid kills",
+        "Verify pilot is active and will contribute - check recent login history",
+        "New to current corp - consider probationary period",
+    ]
@@ -0,0 +1,77 @@
+"""Test API endpoints."""
+
+import asyncio
+
+import pytest
+
+from backend.api import analyze
+from backend.models.applicant import Applicant
+from backend.models.report import AnalysisReport, BatchAnalysisRequest, OverallRisk
+
+
+@pytest.fixture
+def fetched(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Replace ESI/zKill fetches with canned applicants and record lookups."""
+    calls: list[int] = []
+
+    async def build_applicant(character_id: int) -> Applicant:
+        calls.append(character_id)
+        if character_id < 0:
+            raise ValueError("unknown character")
+        return Applicant(character_id=character_id, character_name=f"Pilot {character_id}")
+
+    async def enrich_applicant(applicant: Applicant) -> Applicant:
+        return applicant
+
+    monkeypatch.setattr(analyze.esi_client, "build_applicant", build_applicant)
+    monkeypatch.setattr(analyze.zkill_client, "enrich_applicant", enrich_applicant)
+    return calls
+
+
+async def test_batch_analyze_duplicate_ids(fetched: list[int]):
+    """Test duplicate character IDs are only analyzed once."""
+    request = BatchAnalysisRequest(character_ids=[1, 2, 1, -1, 2])
+
+    result = await analyze.batch_analyze(request)
+
+    assert sorted(fetched) == [-1, 1, 2]
+    assert result.total_requested == 5
+    assert result.completed == 4
+    assert result.failed == 1
+    assert [r.character_id for r in result.reports] == [1, 2, 1, 2]
+
+
+def test_quick_summary():
+    """Test one-line quick check summaries."""
+    report = AnalysisReport(character_id=12345, character_name="Test Pilot")
+    assert analyze._generate_quick_summary(report).startswith("INSUFFICIENT DATA")
+
+    report.overall_risk = OverallRisk.RED
+    assert analyze._generate_quick_summary(report).startswith("HIGH RISK")
+
+
+async def test_batch_analyze_concurrency(monkeypatch: pytest.MonkeyPatch):
+    """Test batch analyses overlap but stay within the concurrency cap."""
+    active = 0
+    peak = 0
+
+    async def build_applicant(character_id: int) -> Applicant:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return Applicant(character_id=character_id, character_name=f"Pilot {character_id}")
+
+    async def enrich_applicant(applicant: Applicant) -> Applicant:
+        return applicant
+
+    monkeypatch.setattr(analyze.esi_client, "build_applicant", build_applicant)
+    monkeypatch.setattr(analyze.zkill_client, "enrich_applicant", enrich_applicant)
+
+    request = BatchAnalysisRequest(character_ids=list(range(1, 13)))
+    result = await analyze.batch_analyze(request)
+
+    assert result.completed == 12
+    assert [r.character_id for r in result.reports] == list(range(1, 13))
+    assert peak == analyze.BATCH_CONCURRENCY
@@ -0,0 +1,160 @@
+"""Test external data connectors."""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import httpx
+
+from backend.connectors.esi import ESIClient
+from backend.connectors.zkill import ZKillClient
+from backend.models.applicant import CorpHistoryEntry
+
+ESI_RESPONSES = {
+    "/characters/12345/": {
+        "name": "Test Pilot",
+        "birthday": "2015-03-01T12:00:00Z",
+        "corporation_id": 98000002,
+        "security_status": 1.5,
+    },
+    "/characters/12345/corporationhistory/": [
+        {"corporation_id": 1000009, "record_id": 1, "start_date": "2015-03-01T12:00:00Z"},
+        {"corporation_id": 98000001, "record_id": 2, "start_date": "2016-01-01T00:00:00Z"},
+        {"corporation_id": 98000002, "record_id": 3, "start_date": "2019-06-15T00:00:00Z"},
+    ],
+    "/corporations/98000002/": {"name": "Second Corp"},
+}
+
+ESI_NAMES = {
+    1000009: "Caldari Provisions",
+    98000001: "First Corp",
+    98000002: "Second Corp",
+}
+
+
+def _esi_client(requests: list[str]) -> ESIClient:
+    """Build an ESI client backed by canned responses."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/latest")
+        requests.append(path)
+        if path == "/universe/names/":
+            ids = json.loads(request.content)
+            return httpx.Response(
+                200,
+                json=[
+                    {"id": i, "name": ESI_NAMES[i], "category": "corporation"}
+                    for i in ids
+                ],
+            )
+        if path not in ESI_RESPONSES:
+            return httpx.Response(404)
+        return httpx.Response(200, json=ESI_RESPONSES[path])
+
+    client = ESIClient()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+async def test_build_applicant_corp_history():
+    """Test building an applicant's corp history from ESI."""
+    requests: list[str] = []
+    client = _esi_client(requests)
+
+    applicant = await client.build_applicant(12345)
+
+    assert applicant.character_name == "Test Pilot"
+    assert applicant.corporation_name == "Second Corp"
+    assert [e.corporation_name for e in applicant.corp_history] == [
+        "Second Corp",
+        "First Corp",
+        "Caldari Provisions",
+    ]
+
+    current, previous, npc = applicant.corp_history
+    assert current.end_date is None
+    assert previous.end_date == current.start_date
+    assert previous.duration_days == (current.start_date - previous.start_date).days
+    assert npc.is_npc and not current.is_npc
+
+    # History names are resolved in a single bulk request
+    assert requests.count("/universe/names/") == 1
+    assert "/corporations/98000001/" not in requests
+
+
+async def test_get_names_uses_cache():
+    """Test bulk name resolution only requests unknown IDs."""
+    requests: list[str] = []
+    client = _esi_client(requests)
+
+    assert await client.get_names([98000001]) == {98000001: "First Corp"}
+    names = await client.get_names([98000001, 98000002, 98000002])
+
+    assert names == {98000001: "First Corp", 98000002: "Second Corp"}
+    assert requests.count("/universe/names/") == 2
+
+
+async def test_build_killboard_stats():
+    """Test summarizing zKillboard kills and losses."""
+    now = datetime.now(UTC)
+    recent = (now - timedelta(days=10)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    older = (now - timedelta(days=60)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    kills = [
+        {
+            "killmail_time": recent,
+            "solar_system_id": 30000142,
+            "victim": {"corporation_id": 98000002},
+            "attackers": [{"character_id": 12345, "ship_type_id": 11987}],
+            "zkb": {"totalValue": 1000.0},
+        },
+        {
+            "killmail_time": older,
+            "solar_system_id": 30000142,
+            "victim": {"corporation_id": 98000009},
+            "attackers": [
+                {"character_id": 12345, "ship_type_id": 11987},
+                {"character_id": 67890, "ship_type_id": 587},
+            ],
+            "zkb": {"totalValue": 500.0},
+        },
+    ]
+    losses = [
+        {"killmail_time": recent, "zkb": {"totalValue": 200.0}},
+        {"killmail_time": older, "zkb": {"totalValue": 300.0}},
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.startswith("/api/kills/"):
+            return httpx.Response(200, json=kills)
+        if path.startswith("/api/losses/"):
+            return httpx.Response(200, json=losses)
+        return httpx.Response(404)
+
+    client = ZKillClient()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    stats = await client.build_killboard_stats(12345, current_corp_id=98000002)
+
+    assert stats.kills_total == 2
+    assert stats.kills_30d == 1
+    assert stats.kills_90d == 2
+    assert stats.solo_kills == 1
+    assert stats.awox_kills == 1
+    assert stats.isk_destroyed == 1500.0
+    assert stats.deaths_total == 2
+    assert stats.deaths_30d == 1
+    assert stats.isk_lost == 500.0
+    assert stats.top_ships == ["11987"]
+    assert stats.top_regions == ["30000142"]
+    assert stats.avg_fleet_size == 1.5
+
+
+async def test_build_applicant_history_matches_schema():
+    """Corp history entries skip validation - make sure they still match the schema."""
+    client = _esi_client([])
+
+    applicant = await client.build_applicant(12345)
+
+    for entry in applicant.corp_history:
+        assert CorpHistoryEntry.model_validate(entry.model_dump()) == entry
@@ -45,3 +45,33 @@ def test_report_risk_calculation():
     assert report.overall_risk == OverallRisk.RED
     assert report.red_flag_count == 2
     assert report.confidence >= 0.5
+
+
+def test_report_flag_counts():
+    """Test report tallies flags by severity."""
+    report = AnalysisReport(
+        character_id=12345,
+        character_name="Test Pilot",
+    )
+
+    report.flags = [
+        RiskFlag(
+            severity=severity,
+            category=FlagCategory.GENERAL,
+            code="TEST",
+            reason="Test reason",
+        )
+        for severity in (
+            FlagSeverity.YELLOW,
+            FlagSeverity.GREEN,
+            FlagSeverity.GREEN,
+            FlagSeverity.GREEN,
+        )
+    ]
+
+    report.calculate_risk()
+
+    assert report.red_flag_count == 0
+    assert report.yellow_flag_count == 1
+    assert report.green_flag_count == 3
+    assert report.overall_risk == OverallRisk.GREEN